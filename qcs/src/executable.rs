@@ -193,18 +193,13 @@ impl<'executable> Executable<'executable, '_> {
         index: usize,
         value: f64,
     ) -> &mut Self {
-        let param_name = param_name.into();
-        let mut values = self
-            .params
-            .remove(&param_name)
-            .unwrap_or_else(|| vec![0.0; index]);
+        let values = self.params.entry(param_name.into()).or_default();
 
-        if index + 1 > values.len() {
+        if index >= values.len() {
             values.resize(index + 1, 0.0);
         }
 
         values[index] = value;
-        self.params.insert(param_name, values);
 
         self
     }
@@ -251,7 +246,7 @@ impl Executable<'_, '_> {
     /// See [`Error`].
     pub async fn execute_on_qvm(&mut self) -> ExecuteResult {
         let config = self.get_config().await.unwrap_or_default();
-        let mut qvm = if let Some(qvm) = self.qvm.take() {
+        let qvm = if let Some(qvm) = self.qvm.take() {
             qvm
         } else {
             qvm::Execution::new(&self.quil)?
@@ -288,12 +283,18 @@ impl Executable<'_, '_> {
 
 impl<'execution> Executable<'_, 'execution> {
     /// Remove and return `self.qpu` if it's set and still valid. Otherwise, create a new one.
+    ///
+    /// The cached [`qpu::Execution`] is only valid if it was built for the same QPU, number of
+    /// shots, and `quilc` setting, since each of those changes the compiled program.
     async fn qpu_for_id(
         &mut self,
         id: &'execution str,
     ) -> Result<qpu::Execution<'execution>, Error> {
         if let Some(qpu) = self.qpu.take() {
-            if qpu.quantum_processor_id == id && qpu.shots == self.shots {
+            if qpu.quantum_processor_id == id
+                && qpu.shots == self.shots
+                && qpu.compile_with_quilc == self.compile_with_quilc
+            {
                 return Ok(qpu);
             }
         }
@@ -548,6 +549,21 @@ mod describe_qpu_for_id {
         assert_eq!(qpu.shots, new_shots);
     }
 
+    #[tokio::test]
+    async fn it_creates_new_after_compile_with_quilc_change() {
+        let mut exe = Executable::from_quil("").compile_with_quilc(true);
+        let qpu = exe.qpu_for_id("Aspen-9").await.unwrap();
+
+        assert!(qpu.compile_with_quilc);
+
+        // Cache so we can verify cache is not used.
+        exe.qpu = Some(qpu);
+        exe = exe.compile_with_quilc(false);
+        let qpu = exe.qpu_for_id("Aspen-9").await.unwrap();
+
+        assert!(!qpu.compile_with_quilc);
+    }
+
     #[tokio::test]
     async fn it_creates_new_for_new_qpu_id() {
         let mut exe = Executable::from_quil("");
@@ -30,6 +30,7 @@ pub(crate) struct Execution<'a> {
     program: RewrittenProgram,
     pub(crate) quantum_processor_id: &'a str,
     pub(crate) shots: u16,
+    pub(crate) compile_with_quilc: bool,
     // All the stuff needed to actually make requests to QCS, lazily initialized
     qcs: Option<Arc<Qcs>>,
 }
@@ -207,6 +208,7 @@ impl<'a> Execution<'a> {
             program: RewrittenProgram::try_from(program).map_err(|e| Error::Quil(e.to_string()))?,
             quantum_processor_id,
             shots,
+            compile_with_quilc,
             qcs: None,
         })
     }
@@ -317,13 +319,15 @@ impl<'a> Execution<'a> {
             .iter()
             .map(|(key, value)| (key.as_ref(), value.clone()))
             .collect();
+        // Substitutions only reference memory, never variables, so one empty map serves them all.
+        let variables = HashMap::new();
         let values = self
             .program
             .substitutions
             .iter()
             .map(|substitution: &Expression| {
                 substitution
-                    .evaluate(&HashMap::new(), &params)
+                    .evaluate(&variables, &params)
                     .map_err(|_| format!("Could not evaluate expression {}", substitution))
                     .and_then(|complex| {
                         if complex.im == 0.0 {
@@ -337,10 +341,8 @@ impl<'a> Execution<'a> {
             })
             .collect::<Result<Vec<f64>, String>>()?;
         // Convert back to the format that this library expects
-        let mut patch_values: Parameters = params
-            .into_iter()
-            .map(|(key, value)| (key.into(), value))
-            .collect();
+        let mut patch_values = Parameters::with_capacity(params.len() + 1);
+        patch_values.extend(params.into_iter().map(|(key, value)| (key.into(), value)));
         patch_values.insert(SUBSTITUTION_NAME.into(), values);
         Ok(patch_values)
     }
@@ -155,10 +155,6 @@ fn organize_ro_sources(
         })
         .collect();
 
-    if buffer_names.is_empty() {
-        return Err(DecodeError::MissingBuffer(String::from("ro")));
-    }
-
     // Sort so that we have one register at a time in ascending index order, making the organization
     // below simpler.
     buffer_names.sort_by(|first, second| {
@@ -169,7 +165,10 @@ fn organize_ro_sources(
     });
 
     // Reorganize and validate all the BufferNames
-    let first = buffer_names.remove(0);
+    let mut buffer_names = buffer_names.into_iter();
+    let first = buffer_names
+        .next()
+        .ok_or_else(|| DecodeError::MissingBuffer(String::from("ro")))?;
     if first.index != 0 {
         return Err(DecodeError::ContiguousMemory {
             register: first.register_name,
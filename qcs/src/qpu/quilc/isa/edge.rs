@@ -42,9 +42,9 @@ impl Edge {
         op_name: &'op_name str,
         characteristics: &[Characteristic],
     ) -> Result<(), Error> {
-        let operator = match GATE_PARAMS.get_key_value(op_name) {
+        let operator = match gate_params(op_name) {
             Some((key, params)) => basic_gates(key, params, characteristics),
-            _ => {
+            None => {
                 if op_name == "WILDCARD" {
                     WILDCARD
                 } else {
@@ -237,37 +237,6 @@ mod describe_convert_edges {
     }
 }
 
-lazy_static::lazy_static! {
-    static ref GATE_PARAMS: HashMap<&'static str, GateParams> = {
-        let mut m = HashMap::new();
-        m.insert("CZ", GateParams{
-            default_fidelity: 0.89,
-            duration: 200.0,
-            characteristic_name: "fCZ",
-            parameters: Parameters::Empty,
-        });
-        m.insert("ISWAP", GateParams{
-            default_fidelity: 0.90,
-            duration: 200.0,
-            characteristic_name: "fISWAP",
-            parameters: Parameters::Empty,
-        });
-        m.insert("CPHASE", GateParams{
-            default_fidelity: 0.85,
-            duration: 200.0,
-            characteristic_name: "fCPHASE",
-            parameters: Parameters::Theta,
-        });
-        m.insert("XY", GateParams{
-            default_fidelity: 0.86,
-            duration: 200.0,
-            characteristic_name: "fXY",
-            parameters: Parameters::Theta,
-        });
-        m
-    };
-}
-
 /// Contains everything you need to know to parse a gate on an edge for a particular op
 struct GateParams {
     default_fidelity: f64,
@@ -276,6 +245,46 @@ struct GateParams {
     parameters: Parameters,
 }
 
+const CZ: GateParams = GateParams {
+    default_fidelity: 0.89,
+    duration: 200.0,
+    characteristic_name: "fCZ",
+    parameters: Parameters::Empty,
+};
+
+const ISWAP: GateParams = GateParams {
+    default_fidelity: 0.90,
+    duration: 200.0,
+    characteristic_name: "fISWAP",
+    parameters: Parameters::Empty,
+};
+
+const CPHASE: GateParams = GateParams {
+    default_fidelity: 0.85,
+    duration: 200.0,
+    characteristic_name: "fCPHASE",
+    parameters: Parameters::Theta,
+};
+
+const XY: GateParams = GateParams {
+    default_fidelity: 0.86,
+    duration: 200.0,
+    characteristic_name: "fXY",
+    parameters: Parameters::Theta,
+};
+
+/// Look up the [`GateParams`] for a supported two-qubit gate, along with the `'static` name to use
+/// for the resulting [`Operator`]. Returns `None` for any other operation.
+fn gate_params(op_name: &str) -> Option<(&'static str, &'static GateParams)> {
+    match op_name {
+        "CZ" => Some(("CZ", &CZ)),
+        "ISWAP" => Some(("ISWAP", &ISWAP)),
+        "CPHASE" => Some(("CPHASE", &CPHASE)),
+        "XY" => Some(("XY", &XY)),
+        _ => None,
+    }
+}
+
 fn basic_gates(
     op_name: &'static str,
     params: &GateParams,
@@ -131,7 +131,9 @@ mod describe_qubit {
     }
 }
 
-pub(crate) struct FrbSim1q(Vec<Characteristic>);
+/// The `randomized_benchmark_simultaneous_1q` fidelities, indexed by the Qubit they were measured on
+/// so that each Qubit's lookup doesn't need to scan every characteristic.
+pub(crate) struct FrbSim1q(HashMap<i32, f64>);
 
 impl TryFrom<Vec<Operation>> for FrbSim1q {
     type Error = Error;
@@ -147,20 +149,30 @@ impl TryFrom<Vec<Operation>> for FrbSim1q {
         }
         let site = operation.sites.remove(0);
 
-        Ok(Self(site.characteristics))
+        Ok(Self::from(site.characteristics))
+    }
+}
+
+impl From<Vec<Characteristic>> for FrbSim1q {
+    fn from(characteristics: Vec<Characteristic>) -> Self {
+        let mut fidelities: HashMap<i32, f64> = HashMap::with_capacity(characteristics.len());
+        for characteristic in characteristics {
+            if let Some([qubit]) = characteristic.node_ids.as_deref() {
+                // Keep the first characteristic for a Qubit, matching the previous linear search
+                fidelities
+                    .entry(*qubit)
+                    .or_insert_with(|| f64::from(characteristic.value));
+            }
+        }
+        Self(fidelities)
     }
 }
 
 impl FrbSim1q {
     fn fidelity_for_qubit(&self, qubit: i32) -> Result<f64, Error> {
         self.0
-            .iter()
-            .find(|characteristic| {
-                characteristic.node_ids.as_ref().map_or(false, |node_ids| {
-                    node_ids.len() == 1 && node_ids[0] == qubit
-                })
-            })
-            .map(|characteristic| characteristic.value.into())
+            .get(&qubit)
+            .copied()
             .ok_or(Error::MissingBenchmarkForQubit(qubit))
     }
 }
@@ -200,7 +212,7 @@ mod describe_rx_gates {
     #[test]
     fn it_passes_the_pyquil_aspen_8_test() {
         let node_id = 1;
-        let frb_sim_1q = FrbSim1q(vec![
+        let frb_sim_1q = FrbSim1q::from(vec![
             Characteristic {
                 name: "fRB".to_string(),
                 value: 0.989_821_537_688_075,
@@ -258,6 +270,20 @@ mod describe_rx_gates {
         ];
         assert_eq!(gates, expected);
     }
+
+    #[test]
+    fn it_errors_when_benchmark_missing_for_qubit() {
+        let frb_sim_1q = FrbSim1q::from(vec![Characteristic {
+            name: "fRB".to_string(),
+            value: 0.989_821_537_688_075,
+            error: None,
+            node_ids: Some(vec![0]),
+            parameter_values: None,
+            timestamp: "1970-01-01T00:00:00+00:00".to_string(),
+        }]);
+        let result = rx_gates(1, &frb_sim_1q);
+        assert!(matches!(result, Err(Error::MissingBenchmarkForQubit(1))));
+    }
 }
 
 fn rz_gates(node_id: i32) -> Vec<Operator> {
@@ -162,11 +162,7 @@ fn divide_2_pi(expression: Expression) -> Expression {
     Expression::Infix {
         left: Box::new(expression),
         operator: InfixOperator::Slash,
-        right: Box::new(Expression::Infix {
-            left: Box::new(Expression::Number(Complex64::from(2.0))),
-            operator: InfixOperator::Star,
-            right: Box::new(Expression::PiConstant),
-        }),
+        right: Box::new(Expression::Number(Complex64::from(std::f64::consts::TAU))),
     }
     .into_simplified()
 }
@@ -246,10 +242,7 @@ fn process_phase(phase: Expression, substitutions: &mut Substitutions) -> Expres
 /// Take an expression and produce or return the existing substitution for it, recording that
 /// substitution in `substitutions`.
 fn substitution(expression: Expression, substitutions: &mut Substitutions) -> Expression {
-    let index = substitutions.get_index_of(&expression).unwrap_or_else(|| {
-        substitutions.insert(expression);
-        substitutions.len() - 1
-    });
+    let (index, _) = substitutions.insert_full(expression);
     let reference = MemoryReference {
         name: String::from(SUBSTITUTION_NAME),
         index: index as u64,
@@ -8,6 +8,12 @@ use zmq::{Context, Socket, SocketType};
 
 use crate::qpu::rpcq::Error::AuthSetup;
 
+lazy_static::lazy_static! {
+    /// One ZeroMQ context for the whole process; every [`Client`] opens its socket on it rather
+    /// than spinning up (and tearing down) a context and its I/O thread per request.
+    static ref CONTEXT: Context = Context::new();
+}
+
 /// A minimal RPCQ client that does just enough to talk to `quilc` and QPU endpoints
 pub(crate) struct Client {
     socket: Socket,
@@ -16,7 +22,7 @@ pub(crate) struct Client {
 impl Client {
     /// Construct a new [`Client`] with no authentication configured.
     pub(crate) fn new(endpoint: &str) -> Result<Self, Error> {
-        let socket = Context::new()
+        let socket = CONTEXT
             .socket(SocketType::DEALER)
             .map_err(Error::SocketCreation)?;
         socket.connect(endpoint).map_err(Error::Communication)?;
@@ -28,7 +34,7 @@ impl Client {
         endpoint: &str,
         credentials: &Credentials,
     ) -> Result<Self, Error> {
-        let socket = Context::new()
+        let socket = CONTEXT
             .socket(SocketType::DEALER)
             .map_err(Error::SocketCreation)?;
         socket
@@ -273,17 +273,18 @@ impl TryFrom<Buffer> for Register {
                     .data
                     .chunks_exact(NUM_BYTES_IN_COMPLEX32)
                     .map(|data: &[u8]| {
-                        let [real, imaginary]: [f32; 2] =
-                            data.chunks_exact(NUM_BYTES_IN_F32)
-                                .map(|data| {
-                                    f32::from_le_bytes(data.try_into().expect(
-                                        "Length of all the pieces was pre-checked up above!",
-                                    ))
-                                })
-                                .collect::<Vec<f32>>()
-                                .try_into()
-                                .expect("Length of all the pieces was pre-checked up above!");
-                        Complex32::new(real, imaginary)
+                        let (real, imaginary) = data.split_at(NUM_BYTES_IN_F32);
+                        Complex32::new(
+                            f32::from_le_bytes(
+                                real.try_into()
+                                    .expect("Length of all the pieces was pre-checked up above!"),
+                            ),
+                            f32::from_le_bytes(
+                                imaginary
+                                    .try_into()
+                                    .expect("Length of all the pieces was pre-checked up above!"),
+                            ),
+                        )
                     })
                     .collect(),
             ),
@@ -1,8 +1,11 @@
-use std::collections::HashMap;
+use std::collections::{BTreeMap, HashMap};
+use std::fmt::Write;
 use std::str::FromStr;
 
+use qcs_api::apis::configuration as api;
 use quil_rs::{
     instruction::{ArithmeticOperand, Instruction, MemoryReference, Move},
+    program::MemoryRegion,
     Program,
 };
 
@@ -15,15 +18,28 @@ use super::{Request, Response};
 /// Contains all the info needed to execute on a QVM a single time, with the ability to be reused for
 /// faster subsequent runs.
 pub(crate) struct Execution {
-    program: Program,
+    /// The memory declared by the program, used to validate parameters.
+    memory_regions: BTreeMap<String, MemoryRegion>,
+    /// The headers (`DECLARE`s, etc.) of the program rendered as Quil, so they aren't re-rendered
+    /// for every run.
+    headers: String,
+    /// The instructions of the program rendered as Quil, so they aren't re-rendered for every run.
+    body: String,
 }
 
 impl Execution {
     /// Construct a new [`Execution`] from Quil. Immediately parses the Quil and returns an error if
     /// there are any problems.
     pub(crate) fn new(quil: &str) -> Result<Self, Error> {
-        let program = Program::from_str(quil).map_err(Error::Parsing)?;
-        Ok(Self { program })
+        let mut program = Program::from_str(quil).map_err(Error::Parsing)?;
+        let body = program.to_string(false);
+        program.instructions.clear();
+        let headers = program.to_string(true);
+        Ok(Self {
+            memory_regions: program.memory_regions,
+            headers,
+            body,
+        })
     }
 
     /// Run on a QVM.
@@ -54,7 +70,7 @@ impl Execution {
     ///
     /// Missing parameters, extra parameters, or parameters of the wrong type will all cause errors.
     pub(crate) async fn run(
-        &mut self,
+        &self,
         shots: u16,
         readouts: &[&str],
         params: &Parameters,
@@ -64,9 +80,18 @@ impl Execution {
             return Err(Error::ShotsMustBePositive);
         }
 
-        let memory = &self.program.memory_regions;
+        let quil = self.quil_with_parameters(params)?;
+        self.execute(quil, shots, readouts, config).await
+    }
 
-        let mut instruction_count = 0;
+    /// Render the program as Quil with `params` set by `MOVE`s at the start of the program.
+    ///
+    /// The `MOVE`s are written out between the pre-rendered headers and body rather than by editing
+    /// and re-rendering the whole program for every run.
+    fn quil_with_parameters(&self, params: &Parameters) -> Result<String, Error> {
+        let memory = &self.memory_regions;
+
+        let mut moves = String::new();
         for (name, values) in params {
             match memory.get(name.as_ref()) {
                 Some(region) => {
@@ -83,36 +108,31 @@ impl Execution {
                 }
             }
             for (index, value) in values.iter().enumerate() {
-                self.program.instructions.insert(
-                    0,
-                    Instruction::Move(Move {
-                        destination: ArithmeticOperand::MemoryReference(MemoryReference {
-                            name: name.to_string(),
-                            index: index as u64,
-                        }),
-                        source: ArithmeticOperand::LiteralReal(*value),
+                let instruction = Instruction::Move(Move {
+                    destination: ArithmeticOperand::MemoryReference(MemoryReference {
+                        name: name.to_string(),
+                        index: index as u64,
                     }),
-                );
-                instruction_count += 1;
+                    source: ArithmeticOperand::LiteralReal(*value),
+                });
+                writeln!(moves, "{}", instruction).expect("Writing to a String cannot fail");
             }
         }
-        let result = self.execute(shots, readouts, config).await;
-        for _ in 0..instruction_count {
-            self.program.instructions.remove(0);
-        }
-        result
+        Ok([self.headers.as_str(), &moves, self.body.as_str()].concat())
     }
 
     async fn execute(
         &self,
+        quil: String,
         shots: u16,
         readouts: &[&str],
         config: &Configuration,
     ) -> Result<HashMap<Box<str>, RegisterData>, Error> {
-        let request = Request::new(&self.program.to_string(true), shots, readouts);
+        let request = Request::new(quil, shots, readouts);
 
-        let client = reqwest::Client::new();
-        let response = client
+        let api_config: &api::Configuration = config.as_ref();
+        let response = api_config
+            .client
             .post(&config.qvm_url)
             .json(&request)
             .send()
@@ -167,9 +187,31 @@ pub(crate) enum Error {
 mod describe_execution {
     use super::{Configuration, Execution, Parameters};
 
+    #[test]
+    fn it_moves_parameters_after_declarations() {
+        let exe = Execution::new("DECLARE theta REAL[2]\nRX(theta[0]) 0").unwrap();
+
+        let mut params = Parameters::new();
+        params.insert("theta".into(), vec![1.0, 2.0]);
+
+        let quil = exe.quil_with_parameters(&params).unwrap();
+        let declare = quil.find("DECLARE theta").expect("Missing DECLARE");
+        let first_move = quil
+            .find("MOVE theta[0]")
+            .expect("Missing MOVE for theta[0]");
+        let second_move = quil
+            .find("MOVE theta[1]")
+            .expect("Missing MOVE for theta[1]");
+        let gate = quil.find("RX(").expect("Missing RX");
+        assert!(declare < first_move);
+        assert!(declare < second_move);
+        assert!(first_move < gate);
+        assert!(second_move < gate);
+    }
+
     #[tokio::test]
     async fn it_errs_on_excess_parameters() {
-        let mut exe = Execution::new("DECLARE ro BIT").unwrap();
+        let exe = Execution::new("DECLARE ro BIT").unwrap();
 
         let mut params = Parameters::new();
         params.insert("doesnt_exist".into(), vec![0.0]);
@@ -184,7 +226,7 @@ mod describe_execution {
 
     #[tokio::test]
     async fn it_errors_when_any_param_is_the_wrong_size() {
-        let mut exe = Execution::new("DECLARE ro BIT[2]").unwrap();
+        let exe = Execution::new("DECLARE ro BIT[2]").unwrap();
 
         let mut params = Parameters::new();
         params.insert("ro".into(), vec![0.0]);
@@ -41,10 +41,10 @@ struct Request<'request> {
 }
 
 impl<'request> Request<'request> {
-    fn new(program: &str, shots: u16, readouts: &[&'request str]) -> Self {
+    fn new(program: String, shots: u16, readouts: &[&'request str]) -> Self {
         let addresses: HashMap<&str, bool> = readouts.iter().map(|v| (*v, true)).collect();
         Self {
-            quil_instructions: program.to_string(),
+            quil_instructions: program,
             addresses,
             trials: shots,
             request_type: RequestType::Multishot,
@@ -65,13 +65,13 @@ mod describe_request {
     #[test]
     fn it_includes_the_program() {
         let program = "H 0";
-        let request = Request::new(program, 1, &[]);
+        let request = Request::new(String::from(program), 1, &[]);
         assert_eq!(&request.quil_instructions, program);
     }
 
     #[test]
     fn it_uses_kebab_case_for_json() {
-        let request = Request::new("H 0", 10, &["ro"]);
+        let request = Request::new(String::from("H 0"), 10, &["ro"]);
         let json_string = serde_json::to_string(&request).expect("Could not serialize QVMRequest");
         assert_eq!(
             serde_json::from_str::<serde_json::Value>(&json_string).unwrap(),
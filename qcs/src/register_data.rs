@@ -48,80 +48,52 @@ impl RegisterData {
                     .get(0)
                     .ok_or_else(|| DecodeError::MissingBuffer(register_name.to_string()))?;
                 match first_register {
-                    Register::I8(_) => Self::try_from_i8_registers(registers, shots),
-                    Register::I16(_) => Self::try_from_i16_registers(registers, shots),
-                    Register::F64(_) => Self::try_from_f64_registers(registers, shots),
-                    Register::Complex32(_) => Self::try_from_complex32_registers(registers, shots),
+                    Register::I8(_) => transpose(registers, shots, Register::into_i8).map(Self::I8),
+                    Register::I16(_) => {
+                        transpose(registers, shots, Register::into_i16).map(Self::I16)
+                    }
+                    Register::F64(_) => {
+                        transpose(registers, shots, Register::into_f64).map(Self::F64)
+                    }
+                    Register::Complex32(_) => {
+                        transpose(registers, shots, Register::into_complex32).map(Self::Complex32)
+                    }
                 }
                 .map(|execution_result| (register_name, execution_result))
             })
             .collect()
     }
-
-    fn try_from_i8_registers(
-        registers: Vec<Register>,
-        number_of_shots: u16,
-    ) -> Result<Self, DecodeError> {
-        let registers = registers
-            .into_iter()
-            .map(|register| register.into_i8().map_err(|_| DecodeError::MixedTypes))
-            .collect::<Result<Vec<Vec<i8>>, DecodeError>>()?;
-
-        Ok(Self::I8(transpose(registers, number_of_shots)))
-    }
-
-    fn try_from_i16_registers(
-        registers: Vec<Register>,
-        number_of_shots: u16,
-    ) -> Result<Self, DecodeError> {
-        let registers = registers
-            .into_iter()
-            .map(|register| register.into_i16().map_err(|_| DecodeError::MixedTypes))
-            .collect::<Result<Vec<Vec<i16>>, DecodeError>>()?;
-
-        Ok(Self::I16(transpose(registers, number_of_shots)))
-    }
-
-    fn try_from_f64_registers(
-        registers: Vec<Register>,
-        number_of_shots: u16,
-    ) -> Result<Self, DecodeError> {
-        let registers = registers
-            .into_iter()
-            .map(|register| register.into_f64().map_err(|_| DecodeError::MixedTypes))
-            .collect::<Result<Vec<Vec<f64>>, DecodeError>>()?;
-
-        Ok(Self::F64(transpose(registers, number_of_shots)))
-    }
-
-    fn try_from_complex32_registers(
-        registers: Vec<Register>,
-        number_of_shots: u16,
-    ) -> Result<Self, DecodeError> {
-        let registers = registers
-            .into_iter()
-            .map(|register| {
-                register
-                    .into_complex32()
-                    .map_err(|_| DecodeError::MixedTypes)
-            })
-            .collect::<Result<Vec<Vec<Complex32>>, DecodeError>>()?;
-
-        Ok(Self::Complex32(transpose(registers, number_of_shots)))
-    }
 }
 
-fn transpose<T>(mut data: Vec<Vec<T>>, len: u16) -> Vec<Vec<T>> {
-    let mut results = Vec::with_capacity(len as usize);
-
-    for _ in 0..len {
-        let mut new_inner = Vec::with_capacity(data.len());
-        for old_inner in &mut data {
-            new_inner.push(old_inner.remove(0));
+/// Convert per-register data (one [`Register`] per register, one entry per shot) into per-shot data
+/// (one `Vec` per shot, one entry per register).
+///
+/// Each register is unwrapped with `into_inner` and consumed front to back exactly once, straight
+/// into the per-shot rows. Any register of a different type than the first is a
+/// [`DecodeError::MixedTypes`].
+fn transpose<T>(
+    registers: Vec<Register>,
+    len: u16,
+    into_inner: fn(Register) -> Result<Vec<T>, Register>,
+) -> Result<Vec<Vec<T>>, DecodeError> {
+    let expected = usize::from(len);
+    let mut results: Vec<Vec<T>> = (0..expected)
+        .map(|_| Vec::with_capacity(registers.len()))
+        .collect();
+
+    for register in registers {
+        let register = into_inner(register).map_err(|_| DecodeError::MixedTypes)?;
+        if register.len() < expected {
+            return Err(DecodeError::BufferLength {
+                expected,
+                actual: register.len(),
+            });
+        }
+        for (shot, value) in results.iter_mut().zip(register) {
+            shot.push(value);
         }
-        results.push(new_inner);
     }
-    results
+    Ok(results)
 }
 
 #[cfg(test)]
@@ -205,6 +177,15 @@ mod describe_program_results {
         assert!(results.is_err());
     }
 
+    #[test]
+    fn it_errors_on_too_few_shots() {
+        let registers = hashmap! {
+            Box::from(String::from("ro")) => vec![Register::I8(vec![1, 2, 3]), Register::I8(vec![4, 5])]
+        };
+        let results = RegisterData::try_from_registers(registers, 3);
+        assert!(results.is_err());
+    }
+
     #[test]
     fn it_handles_mixed_types() {
         let registers = hashmap! {
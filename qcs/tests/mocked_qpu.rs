@@ -104,16 +104,15 @@ mod mock_qcs {
     }
 
     pub(crate) async fn run() {
+        // Load the fixture once rather than re-reading and re-parsing it for every request.
+        let aspen_9_isa =
+            std::fs::read_to_string("tests/aspen_9_isa.json").expect("Could not load Aspen 9 ISA");
+        let aspen_9_isa: InstructionSetArchitecture =
+            serde_json::from_str(&aspen_9_isa).expect("Could not decode aspen 9 ISA");
         let isa = warp::path(QPU_ID)
             .and(warp::path("instructionSetArchitecture"))
             .and(warp::get())
-            .map(|| {
-                let isa = std::fs::read_to_string("tests/aspen_9_isa.json")
-                    .expect("Could not load Aspen 9 ISA");
-                let isa: InstructionSetArchitecture =
-                    serde_json::from_str(&isa).expect("Could not decode aspen 9 ISA");
-                warp::reply::json(&isa)
-            });
+            .map(move || warp::reply::json(&aspen_9_isa));
 
         let translate = warp::path(format!("{}:translateNativeQuilToEncryptedBinary", QPU_ID))
             .and(warp::post())